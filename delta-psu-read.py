@@ -26,6 +26,9 @@ Usage Examples:
     # Read from hex dump file
     python delta-psu-read.py --file ii2c-hex.txt
 
+    # Keep the bus open and print one JSON line every 5 seconds
+    python delta-psu-read.py --daemon --interval 5
+
 Features:
     - Read manufacturer information (ID, model, serial number, etc.)
     - Monitor operating parameters (voltage, current, power, efficiency)
@@ -36,28 +39,92 @@ Features:
     - Output in human-readable or JSON format
     - Support for multiple I2C addresses and buses
     - Support for reading from hex dump files
+    - asyncio wrapper (AsyncDeltaPSU) for use inside an event loop
+    - Daemon mode that keeps the bus open and emits JSON lines
 
 Requirements:
     - Python 3.x
-    - smbus module (python3-smbus package) for I2C access
+    - smbus2 or smbus module (python3-smbus package) for I2C access
+    - orjson (optional) for faster JSON output
     - I2C access permissions (when using I2C mode)
 """
 
 import json
-import smbus
 import argparse
+import ctypes
+import errno
+import os
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import re
+import signal
+import struct
+import sys
+import time
+from typing import NamedTuple
+
+try:
+    import smbus2 as smbus
+    from smbus2 import i2c_msg
+except ImportError:
+    import smbus
+    i2c_msg = None
+
+# fcntl is only needed for RawI2C, which is skipped where it is missing
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# orjson is optional and only speeds up JSON output
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Default I2C address for Delta PSU (can be changed via command line)
 I2C_ADDRESS = 0x60
 
+# Largest transfer supported by an SMBus/I2C block read
+I2C_BLOCK_SIZE = 32
+
+# i2c-dev combined transfer ioctl and read flag (linux/i2c-dev.h, linux/i2c.h)
+I2C_RDWR = 0x0707
+I2C_M_RD = 0x0001
+
+# errno values meaning the adapter or driver cannot do a transfer type at
+# all, as opposed to a NAK or bus glitch that may clear on the next try
+_UNSUPPORTED_ERRNOS = frozenset((errno.ENOTTY, errno.EOPNOTSUPP, errno.EINVAL))
+
+# Every little-endian 16-bit word of a 256-byte snapshot: the words at even
+# offsets in one unpack and the words at odd offsets in another
+_EVEN_WORDS = struct.Struct('<128H').unpack_from
+_ODD_WORDS = struct.Struct('<127H').unpack_from
+
+# Bytes stripped from strings: everything outside printable ASCII
+_NON_PRINTABLE = bytes(range(0x20)) + bytes(range(0x7F, 0x100))
+
+# Scale factors for the signed 5-bit Linear exponent (-16..15, index N + 16)
+_POW2 = tuple(2.0 ** i for i in range(-16, 16))
+
+# VOUT_MODE: mode in the upper 3 bits (0 = Linear), exponent in the lower 5
+VOUT_MODE_LINEAR = 0x00
+
+# Two-digit hex strings in either case mapped to their value
+_HEX_BYTE = {f'{i:02x}': i for i in range(256)}
+_HEX_BYTE.update({f'{i:02X}': i for i in range(256)})
+
+# One line of an i2cdump style hex dump: "00: 01 02 03 ...", optionally
+# followed by an ASCII column. At most 16 byte columns are taken so the ASCII
+# column is never parsed as data, and the last byte may end the line.
+_HEX_LINE_RE = re.compile(r'([0-9A-Fa-f]+):\s+((?:[0-9A-Fa-f]{2}(?:\s+|$)){0,16})')
+
 # PMBus page commands for multi-page devices
 CMD_PAGE = 0x00
-CMD_PAGE_READ = 0x01
-CMD_PAGE_WRITE = 0x02
-CMD_PAGE_READ_BACK = 0x03
-CMD_PAGE_WRITE_BACK = 0x04
+CMD_PAGE_PLUS_WRITE = 0x05
+CMD_PAGE_PLUS_READ = 0x06
 
 # PMBus supported commands for Delta Q54SG series
 # Operation and Configuration Commands
@@ -79,18 +146,18 @@ CMD_IOUT_OC_FAULT_LIMIT = 0x46   # Output overcurrent fault limit
 CMD_IOUT_OC_WARN_LIMIT = 0x4A    # Output overcurrent warning limit
 CMD_OT_FAULT_LIMIT = 0x4F        # Overtemperature fault limit
 CMD_OT_WARN_LIMIT = 0x51         # Overtemperature warning limit
-CMD_UT_FAULT_LIMIT = 0x54        # Undertemperature fault limit
-CMD_UT_WARN_LIMIT = 0x56         # Undertemperature warning limit
-CMD_VIN_UV_FAULT_LIMIT = 0x59    # Input undervoltage fault limit
-CMD_VIN_UV_WARN_LIMIT = 0x5B     # Input undervoltage warning limit
+CMD_UT_WARN_LIMIT = 0x52         # Undertemperature warning limit
+CMD_UT_FAULT_LIMIT = 0x53        # Undertemperature fault limit
 CMD_VIN_OV_FAULT_LIMIT = 0x55    # Input overvoltage fault limit
 CMD_VIN_OV_WARN_LIMIT = 0x57     # Input overvoltage warning limit
-CMD_IIN_OC_FAULT_LIMIT = 0x5F    # Input overcurrent fault limit
-CMD_IIN_OC_WARN_LIMIT = 0x61     # Input overcurrent warning limit
+CMD_VIN_UV_WARN_LIMIT = 0x58     # Input undervoltage warning limit
+CMD_VIN_UV_FAULT_LIMIT = 0x59    # Input undervoltage fault limit
+CMD_IIN_OC_FAULT_LIMIT = 0x5B    # Input overcurrent fault limit
+CMD_IIN_OC_WARN_LIMIT = 0x5D     # Input overcurrent warning limit
 
 # Power Good and Timing Commands
 CMD_POWER_GOOD_ON = 0x5E     # Power good on threshold
-CMD_POWER_GOOD_OFF = 0x60    # Power good off threshold
+CMD_POWER_GOOD_OFF = 0x5F    # Power good off threshold
 CMD_TON_DELAY = 0x60         # Turn-on delay
 CMD_TON_RISE = 0x61          # Turn-on rise time
 CMD_TOFF_DELAY = 0x64        # Turn-off delay
@@ -130,6 +197,150 @@ CMD_MFR_LOCATION = 0x9C     # Manufacturing location
 CMD_MFR_DATE = 0x9D         # Manufacturing date
 CMD_MFR_SERIAL = 0x9E       # Serial number
 
+# Every command code defined above, by name. Two names sharing a code means
+# one of them is wrong, so refuse to load rather than read the wrong register.
+PMBUS_COMMANDS = {name: code for name, code in globals().items() if name.startswith('CMD_')}
+_seen_codes = {}
+for _name, _code in PMBUS_COMMANDS.items():
+    if _code in _seen_codes:
+        raise ValueError(f"{_name} and {_seen_codes[_code]} share PMBus command code 0x{_code:02X}")
+    _seen_codes[_code] = _name
+del _seen_codes, _name, _code
+
+def _linear11(raw_value):
+    """
+    Decode a PMBus Linear11 word.
+    
+    Linear11: Y = X * 2^N
+    where:
+    Y = real value
+    X = mantissa (lower 11 bits, two's complement)
+    N = exponent (upper 5 bits, two's complement)
+    
+    Args:
+        raw_value (int): Raw 16-bit word
+        
+    Returns:
+        float: Decoded value
+    """
+    X = raw_value & 0x7FF  # Lower 11 bits
+    if X & 0x400:
+        X -= 0x800
+    N = (raw_value >> 11) & 0x1F  # Upper 5 bits
+    if N & 0x10:
+        N -= 0x20
+    return X * _POW2[N + 16]
+
+def _linear16(raw_value, exponent):
+    """
+    Decode a PMBus Linear16 word, the format of READ_VOUT.
+    
+    Linear16: Y = V * 2^N
+    where:
+    Y = real value
+    V = raw value (unsigned 16 bits)
+    N = exponent from VOUT_MODE (lower 5 bits, two's complement)
+    
+    Args:
+        raw_value (int): Raw 16-bit word
+        exponent (int): Signed exponent from VOUT_MODE
+        
+    Returns:
+        float: Decoded value
+    """
+    return raw_value * _POW2[exponent + 16]
+
+class _I2cMsg(ctypes.Structure):
+    """struct i2c_msg"""
+    _fields_ = [
+        ('addr', ctypes.c_uint16),
+        ('flags', ctypes.c_uint16),
+        ('len', ctypes.c_uint16),
+        ('buf', ctypes.POINTER(ctypes.c_uint8))
+    ]
+
+class _I2cRdwrIoctlData(ctypes.Structure):
+    """struct i2c_rdwr_ioctl_data"""
+    _fields_ = [
+        ('msgs', ctypes.POINTER(_I2cMsg)),
+        ('nmsgs', ctypes.c_uint32)
+    ]
+
+class RawI2C:
+    """
+    Read fixed register blocks with the I2C_RDWR ioctl on /dev/i2c-N.
+    
+    The message chain (one register write and one block read per block) and
+    the buffers it points into are built once, so poll() is a single ioctl
+    with no per-call argument marshalling.
+    
+    Attributes:
+        fd (int): File descriptor of the i2c-dev node
+        size (int): Bytes read per register block
+    """
+    
+    def __init__(self, bus_number, address, registers, size):
+        """
+        Open the i2c-dev node and build the message chain.
+        
+        Args:
+            bus_number (int): I2C bus number
+            address (int): I2C address of the device
+            registers (sequence): First register of each block
+            size (int): Bytes to read per block
+            
+        Raises:
+            OSError: If the node cannot be opened or fcntl is unavailable
+        """
+        if fcntl is None:
+            raise OSError("fcntl is not available on this platform")
+        self.size = size
+        count = len(registers)
+        self._registers = (ctypes.c_uint8 * count)(*registers)
+        self._buffer = (ctypes.c_uint8 * (count * size))()
+        self._msgs = (_I2cMsg * (2 * count))()
+        u8_ptr = ctypes.POINTER(ctypes.c_uint8)
+        for i in range(count):
+            register = ctypes.cast(ctypes.addressof(self._registers) + i, u8_ptr)
+            data = ctypes.cast(ctypes.addressof(self._buffer) + i * size, u8_ptr)
+            self._msgs[2 * i] = _I2cMsg(address, 0, 1, register)
+            self._msgs[2 * i + 1] = _I2cMsg(address, I2C_M_RD, size, data)
+        self._rdwr = _I2cRdwrIoctlData(self._msgs, 2 * count)
+        self.fd = os.open(f"/dev/i2c-{bus_number}", os.O_RDWR)
+        
+    def poll(self):
+        """
+        Run the whole message chain in one ioctl.
+        
+        Returns:
+            bytes: The blocks read, back to back in register order
+        """
+        fcntl.ioctl(self.fd, I2C_RDWR, self._rdwr)
+        return bytes(self._buffer)
+        
+    def close(self):
+        """
+        Close the i2c-dev node.
+        """
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+class PsuSnapshot(NamedTuple):
+    """
+    The main readings decoded from one register snapshot, in the units of
+    the matching DeltaPSU getters. Use _asdict() to serialize.
+    """
+    vin: float
+    vout: float
+    iout: float
+    temperature: float
+    fan_speed: float
+    duty_cycle: float
+    frequency: float
+    pout: float
+    pin: float
+
 class DeltaPSU:
     """
     Class to interface with Delta Electronics Q54SG series power supply units.
@@ -140,11 +351,110 @@ class DeltaPSU:
     Attributes:
         bus (SMBus): I2C bus object (None when using file mode)
         address (int): I2C address of the PSU
-        hex_data (dict): Dictionary containing hex data (256 bytes)
+        hex_data (bytearray): Cached register data (256 bytes)
         debug (bool): Whether to print debug information
+        cache_ttl (float): Seconds readings are reused before re-reading the device
     """
     
-    def __init__(self, bus_number=1, address=I2C_ADDRESS, hex_file=None, debug=False):
+    # Status registers are stored at specific offsets in the hex data
+    _STATUS_OFFSETS = {
+        CMD_STATUS_WORD: 0x00,      # First word in the dump
+        CMD_STATUS_VOUT: 0x02,      # Second word
+        CMD_STATUS_IOUT: 0x04,      # Third word
+        CMD_STATUS_INPUT: 0x06,     # Fourth word
+        CMD_STATUS_TEMPERATURE: 0x08, # Fifth word
+        CMD_STATUS_CML: 0x0A,       # Sixth word
+        CMD_STATUS_OTHER: 0x0C      # Seventh word
+    }
+    
+    # Readings reported in Linear11; READ_VOUT is Linear16 (see VOUT_MODE)
+    _LINEAR11_CMDS = frozenset([
+        CMD_READ_VIN, CMD_READ_IOUT,
+        CMD_READ_TEMPERATURE_1, CMD_READ_TEMPERATURE_2, CMD_READ_TEMPERATURE_3,
+        CMD_READ_FAN_SPEED_1, CMD_READ_FAN_SPEED_2, CMD_READ_FAN_SPEED_3, CMD_READ_FAN_SPEED_4,
+        CMD_READ_DUTY_CYCLE, CMD_READ_FREQUENCY, CMD_READ_POUT, CMD_READ_PIN
+    ])
+    
+    # Decoder used for each word command; anything not listed is read raw
+    _WORD_FORMATS = dict.fromkeys(_STATUS_OFFSETS, 'status')
+    _WORD_FORMATS.update(dict.fromkeys(_LINEAR11_CMDS, 'linear11'))
+    _WORD_FORMATS[CMD_READ_VOUT] = 'linear16'
+    
+    # (section, key, command) for every word reported by get_all_info
+    _FIELD_TABLE = (
+        ('operating_parameters', 'input_voltage', CMD_READ_VIN),
+        ('operating_parameters', 'output_voltage', CMD_READ_VOUT),
+        ('operating_parameters', 'output_current', CMD_READ_IOUT),
+        ('operating_parameters', 'temperature', CMD_READ_TEMPERATURE_1),
+        ('operating_parameters', 'fan_speed', CMD_READ_FAN_SPEED_1),
+        ('operating_parameters', 'switching_frequency', CMD_READ_FREQUENCY),
+        ('operating_parameters', 'duty_cycle', CMD_READ_DUTY_CYCLE),
+        ('operating_parameters', 'input_power', CMD_READ_PIN),
+        ('operating_parameters', 'output_power', CMD_READ_POUT),
+        ('temperatures', 'temp1', CMD_READ_TEMPERATURE_1),
+        ('temperatures', 'temp2', CMD_READ_TEMPERATURE_2),
+        ('temperatures', 'temp3', CMD_READ_TEMPERATURE_3),
+        ('fan_speeds', 'fan1', CMD_READ_FAN_SPEED_1),
+        ('fan_speeds', 'fan2', CMD_READ_FAN_SPEED_2),
+        ('fan_speeds', 'fan3', CMD_READ_FAN_SPEED_3),
+        ('fan_speeds', 'fan4', CMD_READ_FAN_SPEED_4),
+        ('status', 'status_word', CMD_STATUS_WORD),
+        ('status', 'status_vout', CMD_STATUS_VOUT),
+        ('status', 'status_iout', CMD_STATUS_IOUT),
+        ('status', 'status_input', CMD_STATUS_INPUT),
+        ('status', 'status_temperature', CMD_STATUS_TEMPERATURE),
+        ('status', 'status_cml', CMD_STATUS_CML),
+        ('status', 'status_other', CMD_STATUS_OTHER),
+        ('fault_limits', 'iout_oc_fault_limit', CMD_IOUT_OC_FAULT_LIMIT),
+        ('fault_limits', 'iout_oc_warn_limit', CMD_IOUT_OC_WARN_LIMIT),
+        ('fault_limits', 'ot_fault_limit', CMD_OT_FAULT_LIMIT),
+        ('fault_limits', 'ot_warn_limit', CMD_OT_WARN_LIMIT),
+        ('fault_limits', 'ut_fault_limit', CMD_UT_FAULT_LIMIT),
+        ('fault_limits', 'ut_warn_limit', CMD_UT_WARN_LIMIT),
+        ('fault_limits', 'vin_uv_fault_limit', CMD_VIN_UV_FAULT_LIMIT),
+        ('fault_limits', 'vin_uv_warn_limit', CMD_VIN_UV_WARN_LIMIT),
+        ('fault_limits', 'vin_ov_fault_limit', CMD_VIN_OV_FAULT_LIMIT),
+        ('fault_limits', 'vin_ov_warn_limit', CMD_VIN_OV_WARN_LIMIT),
+        ('fault_limits', 'iin_oc_fault_limit', CMD_IIN_OC_FAULT_LIMIT),
+        ('fault_limits', 'iin_oc_warn_limit', CMD_IIN_OC_WARN_LIMIT),
+        ('timing_parameters', 'ton_delay', CMD_TON_DELAY),
+        ('timing_parameters', 'ton_rise', CMD_TON_RISE),
+        ('timing_parameters', 'toff_delay', CMD_TOFF_DELAY),
+        ('timing_parameters', 'toff_fall', CMD_TOFF_FALL)
+    )
+    
+    # Command behind each PsuSnapshot field, in field order
+    _SNAPSHOT_CMDS = (
+        CMD_READ_VIN, CMD_READ_VOUT, CMD_READ_IOUT, CMD_READ_TEMPERATURE_1,
+        CMD_READ_FAN_SPEED_1, CMD_READ_DUTY_CYCLE, CMD_READ_FREQUENCY,
+        CMD_READ_POUT, CMD_READ_PIN
+    )
+    
+    # Strings read_string takes from their own command offset
+    _STRING_CMDS = (CMD_MFR_REVISION, CMD_MFR_LOCATION, CMD_MFR_DATE)
+    
+    # Sections get_all_info() can report, in output order
+    SECTIONS = ('manufacturer_info',) + tuple(dict.fromkeys(section for section, _, _ in _FIELD_TABLE))
+    
+    # Snapshot offsets the decoders look at. Only these are fetched from the
+    # device; the rest of the register space is left zeroed.
+    _KNOWN_OFFSETS = frozenset(
+        list(range(0x00, 0x0E)) +           # status words
+        list(range(0x0C, 0x0C + 5)) +       # MFR_ID
+        list(range(0x10, 0x10 + 11)) +      # MFR_MODEL
+        list(range(0x30, 0x30 + 12)) +      # MFR_SERIAL
+        [offset for _, _, command in _FIELD_TABLE for offset in (command, command + 1)] +
+        [CMD_VOUT_MODE] +
+        [offset for command in _STRING_CMDS for offset in range(command, command + 16)] +
+        [CMD_PMBUS_REVISION]
+    )
+    
+    # Block read start addresses covering _KNOWN_OFFSETS
+    _SNAPSHOT_BLOCKS = tuple(sorted(set(offset - offset % I2C_BLOCK_SIZE
+                                        for offset in _KNOWN_OFFSETS)))
+    
+    def __init__(self, bus_number=1, address=I2C_ADDRESS, hex_file=None, debug=False,
+                 cache_ttl=1.0):
         """
         Initialize the PSU interface.
         
@@ -153,45 +463,193 @@ class DeltaPSU:
             address (int): I2C address of the PSU (default: 0x60)
             hex_file (str): Path to hex dump file (optional)
             debug (bool): Whether to print debug information
+            cache_ttl (float): Seconds to reuse the register snapshot and
+                get_all_info() results before re-reading the device
+                (default: 1.0, 0 re-reads on every call)
         """
         self.address = address
-        self.hex_data = {}
+        self.hex_data = bytearray(256)
         self.debug = debug
+        self.cache_ttl = cache_ttl
+        self._snapshot_time = None
+        self._info_cache = None
+        self._info_cache_key = None
+        self._info_cache_time = 0.0
+        self._raw = None
+        self._rdwr_msgs = None
+        self._string_msgs = None
+        self._block_strings = {}
+        self._strings_batched = False
+        self._vout_exponent = None
+        self._words = None
         
         if hex_file:
             self.bus = None
             self._load_hex_file(hex_file)
         else:
             self.bus = smbus.SMBus(bus_number)
+            try:
+                self._raw = RawI2C(bus_number, address, self._SNAPSHOT_BLOCKS, I2C_BLOCK_SIZE)
+            except OSError as e:
+                if self.debug:
+                    print(f"Raw I2C_RDWR unavailable ({e}), using smbus")
+            if i2c_msg is not None:
+                # Built once and reused by every refresh
+                self._rdwr_msgs = []
+                for base in self._SNAPSHOT_BLOCKS:
+                    self._rdwr_msgs.append(i2c_msg.write(address, [base]))
+                    self._rdwr_msgs.append(i2c_msg.read(address, I2C_BLOCK_SIZE))
+                # Block Read of every _STRING_CMDS entry: length byte + data
+                self._string_msgs = []
+                for command in self._STRING_CMDS:
+                    self._string_msgs.append(i2c_msg.write(address, [command]))
+                    self._string_msgs.append(i2c_msg.read(address, I2C_BLOCK_SIZE + 1))
+            self._load_smbus_data()
+            
+    def refresh(self):
+        """
+        Re-read the register snapshot from the device.
+        
+        Data loaded from a hex dump file is static, so this does nothing in
+        file mode.
+        """
+        self._info_cache = None
+        if self.bus is not None:
+            self._block_strings = {}
+            self._strings_batched = False
             self._load_smbus_data()
             
+    def _ensure_fresh(self):
+        """
+        Re-read the snapshot if it is older than cache_ttl. Public accessors
+        call this once before decoding from hex_data.
+        """
+        if self.bus is None:
+            return
+        if self._snapshot_time is None or time.monotonic() - self._snapshot_time >= self.cache_ttl:
+            self.refresh()
+            
+    def _invalidate(self):
+        """
+        Mark the cached snapshot and decoded info as stale.
+        """
+        self._info_cache = None
+        self._snapshot_time = None
+            
     def _load_smbus_data(self):
         """
-        Load first 256 bytes from SMBus device.
+        Load the used part of the first 256 bytes from SMBus device.
+        
+        The data is fetched in 32-byte blocks, skipping blocks that hold no
+        offset in _KNOWN_OFFSETS. All blocks are requested in a single
+        I2C_RDWR call, through RawI2C or smbus2; if neither is usable, or the
+        adapter rejects it, each block is read with its own I2C block read.
         """
         try:
             if self.debug:
                 print(f"\nLoading SMBus data from address 0x{self.address:02X}")
             
-            # Read first 256 bytes
-            for addr in range(256):
-                try:
-                    value = self.bus.read_byte_data(self.address, addr)
-                    self.hex_data[addr] = value
-                except:
-                    self.hex_data[addr] = 0
+            chunks = self._read_blocks_rdwr()
+            if chunks is None:
+                chunks = [self._read_block(base) for base in self._SNAPSHOT_BLOCKS]
+            
+            # Fill a new buffer so a failed refresh leaves the old snapshot intact
+            data = bytearray(len(self.hex_data))
+            for base, chunk in zip(self._SNAPSHOT_BLOCKS, chunks):
+                data[base:base + len(chunk)] = chunk
+            self.hex_data = data
+            self._snapshot_time = time.monotonic()
+            self._split_words()
+            self._resolve_vout_mode()
                     
             if self.debug:
-                print(f"Loaded {len(self.hex_data)} bytes from SMBus")
-                print("First few bytes:")
-                for addr in sorted(self.hex_data.keys())[:10]:
-                    print(f"  0x{addr:02X}: 0x{self.hex_data[addr]:02X}")
+                print(f"Loaded {len(self._SNAPSHOT_BLOCKS) * I2C_BLOCK_SIZE} bytes from SMBus")
+                self._print_first_bytes()
                     
         except Exception as e:
             if self.debug:
                 print(f"Error reading SMBus data: {e}")
             raise
             
+    def _read_blocks_rdwr(self):
+        """
+        Read every snapshot block in one combined I2C_RDWR transaction.
+        
+        RawI2C is tried first, then the smbus2 message list; both are built
+        once in __init__. A method the adapter does not support is dropped,
+        so later refreshes go straight to the next one; after any other
+        error it is skipped for this refresh only.
+        
+        Returns:
+            list: Bytes read for each entry in _SNAPSHOT_BLOCKS, or None
+                if neither is available or the adapter rejects the call
+        """
+        raw = self._raw
+        if raw is not None:
+            try:
+                data = raw.poll()
+            except OSError as e:
+                if self.debug:
+                    print(f"Raw I2C_RDWR failed ({e}), using smbus")
+                if e.errno in _UNSUPPORTED_ERRNOS:
+                    raw.close()
+                    self._raw = None
+            else:
+                size = raw.size
+                return [data[i:i + size] for i in range(0, len(data), size)]
+        
+        msgs = self._rdwr_msgs
+        if msgs is None:
+            return None
+        
+        try:
+            self.bus.i2c_rdwr(*msgs)
+        except OSError as e:
+            if self.debug:
+                print(f"I2C_RDWR failed ({e}), using block reads")
+            if e.errno in _UNSUPPORTED_ERRNOS:
+                self._rdwr_msgs = None
+            return None
+        return [bytes(msg) for msg in msgs[1::2]]
+        
+    def _read_block(self, base):
+        """
+        Read one snapshot block. If the block read fails, only the known
+        offsets in the block are read one byte at a time; registers the
+        device refuses are left as 0.
+        
+        Args:
+            base (int): First register of the block
+            
+        Returns:
+            list: I2C_BLOCK_SIZE byte values
+            
+        Raises:
+            OSError: If none of the known offsets in the block can be read,
+                so an unreachable device is not reported as zeros
+        """
+        try:
+            return self.bus.read_i2c_block_data(self.address, base, I2C_BLOCK_SIZE)
+        except OSError as e:
+            if self.debug:
+                print(f"Block read at 0x{base:02X} failed ({e}), reading bytewise")
+        
+        chunk = []
+        read_any = False
+        error = None
+        for addr in range(base, base + I2C_BLOCK_SIZE):
+            value = 0
+            if addr in self._KNOWN_OFFSETS:
+                try:
+                    value = self.bus.read_byte_data(self.address, addr)
+                    read_any = True
+                except OSError as e:
+                    error = e
+            chunk.append(value)
+        if error is not None and not read_any:
+            raise error
+        return chunk
+            
     def _load_hex_file(self, hex_file):
         """
         Load hex data from a file.
@@ -203,52 +661,102 @@ class DeltaPSU:
             if self.debug:
                 print(f"\nLoading hex file: {hex_file}")
             
-            with open(hex_file, 'r') as f:
-                lines = f.readlines()
-            
-            if self.debug:
-                print(f"Found {len(lines)} lines in file")
-                print(f"First line (header): {lines[0].strip()}")
+            loaded = 0
+            line_num = 0
+            self._snapshot_time = time.monotonic()
             
-            # Skip the first line (header)
-            for line_num, line in enumerate(lines[1:], 1):
-                line = line.strip()
-                if not line:  # Skip empty lines
-                    continue
+            # Lines are parsed as they are read rather than loaded up front
+            with open(hex_file, 'r') as f:
+                header = f.readline()
+                if self.debug:
+                    print(f"First line (header): {header.strip()}")
+                
+                # The first line (header) was consumed above
+                for line_num, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:  # Skip empty lines
+                        continue
                     
-                # Parse the line format: "00: 01 02 03 ..."
-                match = re.match(r'(\w+):\s+((?:\w{2}\s+)*)', line)
-                if match:
-                    offset = int(match.group(1), 16)
-                    hex_values = match.group(2).strip().split()
-                    if self.debug:
-                        print(f"\nLine {line_num}:")
-                        print(f"  Offset: 0x{offset:02X}")
-                        print(f"  Hex values: {' '.join(hex_values)}")
+                    # Parse the line format: "00: 01 02 03 ..."
+                    match = _HEX_LINE_RE.match(line)
+                    if match:
+                        offset = _HEX_BYTE.get(match.group(1))
+                        if offset is None:
+                            offset = int(match.group(1), 16)
+                        chunk = bytes.fromhex(match.group(2))
+                        if self.debug:
+                            print(f"\nLine {line_num}:")
+                            print(f"  Offset: 0x{offset:02X}")
+                            print(f"  Hex values: {chunk.hex(' ')}")
                     
-                    for i, hex_val in enumerate(hex_values):
-                        value = int(hex_val, 16)
-                        self.hex_data[offset + i] = value
+                        # Drop anything past the end of the register space
+                        chunk = chunk[:max(0, len(self.hex_data) - offset)]
+                        self.hex_data[offset:offset + len(chunk)] = chunk
+                        loaded += len(chunk)
                         if self.debug:
-                            print(f"    Address 0x{offset + i:02X}: 0x{value:02X}")
-                elif self.debug:
-                    print(f"\nWarning: Line {line_num} did not match expected format:")
-                    print(f"  Line: {line}")
+                            for i, value in enumerate(chunk):
+                                print(f"    Address 0x{offset + i:02X}: 0x{value:02X}")
+                    elif self.debug:
+                        print(f"\nWarning: Line {line_num} did not match expected format:")
+                        print(f"  Line: {line}")
+            
+            self._split_words()
+            self._resolve_vout_mode()
             
             if self.debug:
-                print(f"\nLoaded {len(self.hex_data)} bytes from hex file")
-                print("First few bytes:")
-                for addr in sorted(self.hex_data.keys())[:10]:
-                    print(f"  0x{addr:02X}: 0x{self.hex_data[addr]:02X}")
+                print(f"\nRead {line_num + 1 if header else 0} lines from file")
+                print(f"Loaded {loaded} bytes from hex file")
+                self._print_first_bytes()
                     
         except Exception as e:
             if self.debug:
                 print(f"Error reading hex file: {e}")
             raise
         
+    def _split_words(self):
+        """
+        Unpack the word starting at every offset of the snapshot once per
+        load, so decoders only index into _words. The last register has no
+        second byte and is taken as-is.
+        """
+        data = self.hex_data
+        words = [0] * len(data)
+        words[0::2] = _EVEN_WORDS(data)
+        words[1:-1:2] = _ODD_WORDS(data, 1)
+        words[-1] = data[-1]
+        self._words = words
+        
+    def _resolve_vout_mode(self):
+        """
+        Decode VOUT_MODE from the snapshot once per load. READ_VOUT is only
+        scaled when the mode is Linear; otherwise it is reported raw.
+        """
+        mode = self.hex_data[CMD_VOUT_MODE]
+        if mode >> 5 == VOUT_MODE_LINEAR:
+            exponent = mode & 0x1F
+            if exponent & 0x10:
+                exponent -= 0x20
+            self._vout_exponent = exponent
+        else:
+            self._vout_exponent = None
+        if self.debug:
+            print(f"VOUT_MODE: 0x{mode:02X} (exponent {self._vout_exponent})")
+        
+    def _print_first_bytes(self, count=10):
+        """
+        Print the first few cached bytes for debugging.
+        
+        Args:
+            count (int): Number of bytes to print
+        """
+        print("First few bytes:")
+        for addr in range(min(count, len(self.hex_data))):
+            print(f"  0x{addr:02X}: 0x{self.hex_data[addr]:02X}")
+        
     def read_byte(self, command):
         """
-        Read a single byte from the cached data.
+        Read a single byte from the cached data. In bus mode, registers the
+        snapshot does not hold are read from the device directly.
         
         Args:
             command (int): PMBus command code
@@ -256,7 +764,19 @@ class DeltaPSU:
         Returns:
             int: Byte value read from the device
         """
-        value = self.hex_data.get(command, 0)
+        if self.bus is not None and command not in self._KNOWN_OFFSETS:
+            value = self.bus.read_byte_data(self.address, command)
+            if self.debug:
+                print(f"read_byte(0x{command:02X}) -> 0x{value:02X} (direct)")
+            return value
+        self._ensure_fresh()
+        return self._read_byte(command)
+        
+    def _read_byte(self, command):
+        """
+        Read a single byte from hex_data without checking its age.
+        """
+        value = self.hex_data[command] if command < len(self.hex_data) else 0
         if self.debug:
             print(f"read_byte(0x{command:02X}) -> 0x{value:02X}")
         return value
@@ -272,143 +792,159 @@ class DeltaPSU:
         if self.bus is None:
             raise RuntimeError("Write operations not supported in file mode")
         self.bus.write_byte_data(self.address, command, value)
+        self._invalidate()
         
     def read_word(self, command):
         """
         Read a word (2 bytes) from the cached data.
-        Handles PMBus linear data format.
+        Handles PMBus linear data format. In bus mode, words the snapshot
+        does not hold are read from the device directly and returned raw.
         
         Args:
             command (int): PMBus command code
             
         Returns:
-            int: Word value read from the device
-        """
-        # Handle special cases for status registers
-        if command in [CMD_STATUS_WORD, CMD_STATUS_VOUT, CMD_STATUS_IOUT,
-                     CMD_STATUS_INPUT, CMD_STATUS_TEMPERATURE, CMD_STATUS_CML,
-                     CMD_STATUS_OTHER]:
-            # Status registers are stored at specific offsets in the hex data
-            status_offsets = {
-                CMD_STATUS_WORD: 0x00,      # First word in the dump
-                CMD_STATUS_VOUT: 0x02,      # Second word
-                CMD_STATUS_IOUT: 0x04,       # Third word
-                CMD_STATUS_INPUT: 0x06,     # Fourth word
-                CMD_STATUS_TEMPERATURE: 0x08, # Fifth word
-                CMD_STATUS_CML: 0x0A,       # Sixth word
-                CMD_STATUS_OTHER: 0x0C      # Seventh word
-            }
-            offset = status_offsets.get(command, command)
-            byte1 = self.hex_data.get(offset, 0)
-            byte2 = self.hex_data.get(offset + 1, 0)
-            value = (byte2 << 8) | byte1  # Little-endian format
+            int or float: Status and raw words as int, Linear11/Linear16
+                readings decoded to float
+        """
+        if self.bus is not None and not self._KNOWN_OFFSETS.issuperset((command, command + 1)):
+            value = self.bus.read_word_data(self.address, command)
             if self.debug:
-                print(f"read_word(0x{command:02X}) -> 0x{value:04X} (from offset 0x{offset:02X}: 0x{byte2:02X} 0x{byte1:02X})")
+                print(f"read_word(0x{command:02X}) -> 0x{value:04X} (direct)")
             return value
+        self._ensure_fresh()
+        return self._decode_word(command)
         
-        # Special handling for VIN - read from offset 0x88 in Linear11 format
-        if command == CMD_READ_VIN:
-            # Read the raw value from offset 0x88
-            byte1 = self.hex_data.get(0x88, 0)
-            byte2 = self.hex_data.get(0x89, 0)
-            raw_value = (byte2 << 8) | byte1  # Little-endian format
-            
-            if self.debug:
-                print(f"VIN raw value from 0x88: 0x{raw_value:04X} (0x{byte2:02X} 0x{byte1:02X})")
-            
-            # Parse Linear11 format
-            # Linear11: Y = (mX + b) * 2^R
-            # where:
-            # Y = real value
-            # X = raw value (11 bits)
-            # m = coefficient (5 bits)
-            # b = offset (11 bits)
-            # R = exponent (5 bits)
-            
-            # Extract components from raw value
-            X = raw_value & 0x7FF  # Lower 11 bits
-            m = (raw_value >> 11) & 0x1F  # Next 5 bits
-            b = (raw_value >> 16) & 0x7FF  # Next 11 bits
-            R = (raw_value >> 27) & 0x1F  # Upper 5 bits
-            
-            if self.debug:
-                print(f"Linear11 components: X={X}, m={m}, b={b}, R={R}")
-            
-            # Calculate real value
-            real_value = (m * X + b) * (2 ** R)
-            
-            if self.debug:
-                print(f"VIN calculated value: {real_value}V")
-            
-            return real_value
+    def _decode_word(self, command):
+        """
+        Decode a word from hex_data without checking its age.
+        """
+        decoder = self._DECODERS[self._WORD_FORMATS.get(command, 'raw')]
+        return decoder(self, command)
+        
+    def _decode_status(self, command):
+        """
+        Decode a status register from its offset in the hex data.
+        
+        Args:
+            command (int): PMBus status command code
             
-        # Read two bytes and combine them
-        byte1 = self.hex_data.get(command, 0)
-        byte2 = self.hex_data.get(command + 1, 0)
-        value = (byte2 << 8) | byte1  # Little-endian format
+        Returns:
+            int: Status word value
+        """
+        offset = self._STATUS_OFFSETS[command]
+        value = self._words[offset]
         if self.debug:
-            print(f"read_word(0x{command:02X}) -> 0x{value:04X} (0x{byte2:02X} 0x{byte1:02X})")
-        
-        # Handle PMBus linear data format
-        if command in [CMD_READ_VOUT, CMD_READ_IOUT, CMD_READ_PIN, CMD_READ_POUT]:
-            # For voltage, current, and power readings
-            # Y = (mX + b) * 10^R
-            # where:
-            # Y = real value
-            # X = raw value
-            # m = coefficient (stored in upper 5 bits)
-            # b = offset (stored in lower 11 bits)
-            # R = exponent (stored in upper 5 bits)
-            
-            # Get the mode byte for this command
-            mode_cmd = command - 0x80  # Convert to mode command
-            mode = self.hex_data.get(mode_cmd, 0)
-            
-            if self.debug:
-                print(f"  Mode byte: 0x{mode:02X}")
-            
-            # Extract m, b, and R from mode byte
-            m = (mode >> 3) & 0x1F
-            b = mode & 0x07
-            R = (mode >> 3) & 0x1F
-            
-            # Calculate real value
-            real_value = (m * value + b) * (10 ** R)
-            
-            if self.debug:
-                print(f"  Linear format: m={m}, b={b}, R={R}")
-                print(f"  Raw value: {value}")
-                print(f"  Real value: {real_value}")
-            
-            return int(real_value)
+            print(f"read_word(0x{command:02X}) -> 0x{value:04X} (from offset 0x{offset:02X})")
+        return value
+        
+    def _decode_linear11(self, command):
+        """
+        Decode a Linear11 reading (VIN, IOUT, power, temperature, fan speed,
+        duty cycle and frequency).
+        
+        Args:
+            command (int): PMBus command code
             
-        elif command in [CMD_READ_TEMPERATURE_1, CMD_READ_TEMPERATURE_2, CMD_READ_TEMPERATURE_3]:
-            # For temperature readings
-            # Y = (mX + b) * 10^R
-            # where m=1, b=0, R=0 for temperature
-            return value
+        Returns:
+            float: Decoded value
+        """
+        raw_value = self._words[command]
+        real_value = _linear11(raw_value)
+        
+        if self.debug:
+            print(f"read_word(0x{command:02X}) -> 0x{raw_value:04X} (Linear11: {real_value})")
+        
+        return real_value
+        
+    def _decode_linear16(self, command):
+        """
+        Decode READ_VOUT using the exponent resolved from VOUT_MODE.
+        
+        Args:
+            command (int): PMBus command code
             
-        elif command in [CMD_READ_FAN_SPEED_1, CMD_READ_FAN_SPEED_2, CMD_READ_FAN_SPEED_3, CMD_READ_FAN_SPEED_4]:
-            # For fan speed readings
-            # Y = (mX + b) * 10^R
-            # where m=1, b=0, R=0 for fan speed
-            return value
+        Returns:
+            float: Decoded value, or the raw word if VOUT_MODE is not Linear
+        """
+        raw_value = self._words[command]
+        if self._vout_exponent is None:
+            real_value = raw_value
+        else:
+            real_value = _linear16(raw_value, self._vout_exponent)
+        
+        if self.debug:
+            print(f"read_word(0x{command:02X}) -> 0x{raw_value:04X} (Linear16: {real_value})")
+        
+        return real_value
+        
+    def _decode_raw(self, command):
+        """
+        Read a word as-is. Used for limits, timing and any command without a
+        known data format.
+        
+        Args:
+            command (int): PMBus command code
             
-        elif command in [CMD_READ_DUTY_CYCLE]:
-            # For duty cycle readings
-            # Y = (mX + b) * 10^R
-            # where m=1, b=0, R=0 for duty cycle
-            return value
+        Returns:
+            int: Word value
+        """
+        value = self._words[command] if command < len(self._words) else 0
+        if self.debug:
+            print(f"read_word(0x{command:02X}) -> 0x{value:04X}")
+        return value
+        
+    def _decode_section(self, section):
+        """
+        Decode one _FIELD_TABLE section from a fresh snapshot.
+        
+        Args:
+            section (str): Section name, e.g. 'temperatures'
             
-        elif command in [CMD_READ_FREQUENCY]:
-            # For frequency readings
-            # Y = (mX + b) * 10^R
-            # where m=1, b=0, R=0 for frequency
-            return value
+        Returns:
+            dict: Decoded values for the section
+        """
+        self._ensure_fresh()
+        return self._decode_all((section,))[section]
+        
+    _DECODERS = {
+        'status': _decode_status,
+        'linear11': _decode_linear11,
+        'linear16': _decode_linear16,
+        'raw': _decode_raw
+    }
+    
+    def _decode_all(self, sections=None):
+        """
+        Decode every field in _FIELD_TABLE in a single pass. Each command is
+        decoded once, even when it is reported in several sections.
+        
+        Args:
+            sections (iterable): Only decode these sections (default: all)
             
-        else:
-            # For other readings, return raw value
-            return value
+        Returns:
+            dict: Decoded values grouped by section
+        """
+        # Bind the lookups used per field to locals once, outside the loop
+        decoders = self._DECODERS
+        word_format = self._WORD_FORMATS.get
+        result = {}
+        # Commands listed in more than one section are decoded once
+        words = {}
+        section_values = None
+        current_section = None
+        for section, key, command in self._FIELD_TABLE:
+            if sections is not None and section not in sections:
+                continue
+            if section != current_section:
+                section_values = result.setdefault(section, {})
+                current_section = section
+            if command in words:
+                value = words[command]
+            else:
+                value = words[command] = decoders[word_format(command, 'raw')](self, command)
+            section_values[key] = value
+        return result
         
     def write_word(self, command, value):
         """
@@ -421,6 +957,7 @@ class DeltaPSU:
         if self.bus is None:
             raise RuntimeError("Write operations not supported in file mode")
         self.bus.write_word_data(self.address, command, value)
+        self._invalidate()
         
     def read_string(self, command, length=16):
         """
@@ -431,40 +968,112 @@ class DeltaPSU:
             length (int): Maximum length of string to read
             
         Returns:
-            str: String read from the device, or "Not Available" if read fails
+            str: String read from the device
+            
+        Raises:
+            OSError: If the snapshot has to be refreshed and the device
+                cannot be read
         """
-        try:
-            # Handle special cases for manufacturer data
-            if command == CMD_MFR_ID:
-                # Read from offset 0x0C where "DELTA" is stored
-                data = [self.hex_data.get(0x0C + i, 0) for i in range(5)]  # "DELTA" is 5 characters
-                if self.debug:
-                    print(f"Manufacturer data from offset 0x0C: {' '.join([f'0x{x:02X}' for x in data])}")
-            elif command == CMD_MFR_MODEL:
-                # Read from offset 0x10 where model number is stored
-                data = [self.hex_data.get(0x10 + i, 0) for i in range(11)]  # "DPS-800AB-30" is 11 characters
-                if self.debug:
-                    print(f"Model data from offset 0x10: {' '.join([f'0x{x:02X}' for x in data])}")
-            elif command == CMD_MFR_SERIAL:
-                # Read from offset 0x30 where serial number is stored
-                data = [self.hex_data.get(0x30 + i, 0) for i in range(12)]  # "IBKD2022005142" is 12 characters
-                if self.debug:
-                    print(f"Serial data from offset 0x30: {' '.join([f'0x{x:02X}' for x in data])}")
+        self._ensure_fresh()
+        return self._read_string(command, length)
+        
+    def _read_string(self, command, length=16):
+        """
+        Read a string from hex_data without checking its age.
+        """
+        # Handle special cases for manufacturer data
+        if command == CMD_MFR_ID:
+            # Read from offset 0x0C where "DELTA" is stored
+            data = self.hex_data[0x0C:0x0C + 5]  # "DELTA" is 5 characters
+            if self.debug:
+                print(f"Manufacturer data from offset 0x0C: {' '.join([f'0x{x:02X}' for x in data])}")
+        elif command == CMD_MFR_MODEL:
+            # Read from offset 0x10 where model number is stored
+            data = self.hex_data[0x10:0x10 + 11]  # "DPS-800AB-30" is 11 characters
+            if self.debug:
+                print(f"Model data from offset 0x10: {' '.join([f'0x{x:02X}' for x in data])}")
+        elif command == CMD_MFR_SERIAL:
+            # Read from offset 0x30 where serial number is stored
+            data = self.hex_data[0x30:0x30 + 12]  # "IBKD2022005142" is 12 characters
+            if self.debug:
+                print(f"Serial data from offset 0x30: {' '.join([f'0x{x:02X}' for x in data])}")
+        else:
+            data = self._read_block_string(command)
+            if data is not None:
+                data = data[:length]
             else:
                 # For other strings, use the command address
-                data = [self.hex_data.get(command + i, 0) for i in range(length)]
-                if self.debug:
-                    print(f"read_string(0x{command:02X}, {length}) raw data: {' '.join([f'0x{x:02X}' for x in data])}")
-            
-            # Filter out non-printable characters and special characters
-            result = ''.join([chr(x) for x in data if x != 0 and 32 <= x <= 126])
+                data = self.hex_data[command:command + length]
+                # A plausible PMBus length byte gives the exact string;
+                # devices that do not prefix start with printable text
+                if data and 0 < data[0] < length:
+                    data = data[1:1 + data[0]]
             if self.debug:
-                print(f"read_string(0x{command:02X}, {length}) -> '{result}'")
-            return result
-        except Exception as e:
+                print(f"read_string(0x{command:02X}, {length}) raw data: {' '.join([f'0x{x:02X}' for x in data])}")
+        
+        # Filter out non-printable characters and special characters
+        result = data.translate(None, _NON_PRINTABLE).decode('ascii')
+        if self.debug:
+            print(f"read_string(0x{command:02X}, {length}) -> '{result}'")
+        return result
+        
+    def _read_block_string(self, command):
+        """
+        Read a PMBus string with an SMBus Block Read.
+        
+        The device sends a length byte followed by only that many bytes, so
+        short strings are not padded out to a fixed read size. With smbus2
+        all _STRING_CMDS are fetched together on first use. Results are
+        kept until the next refresh.
+        
+        Args:
+            command (int): PMBus command code
+            
+        Returns:
+            bytes: String bytes, or None in file mode or if the device or
+                adapter does not support block reads
+        """
+        if self.bus is None:
+            return None
+        if (command not in self._block_strings and command in self._STRING_CMDS
+                and not self._strings_batched):
+            self._read_block_strings_rdwr()
+        if command not in self._block_strings:
+            try:
+                self._block_strings[command] = bytes(self.bus.read_block_data(self.address, command))
+            except OSError as e:
+                if self.debug:
+                    print(f"Block read of 0x{command:02X} failed ({e}), using cached data")
+                self._block_strings[command] = None
+        return self._block_strings[command]
+        
+    def _read_block_strings_rdwr(self):
+        """
+        Read every _STRING_CMDS string in one combined I2C_RDWR transaction
+        and store them in _block_strings.
+        
+        Each string is read as its length byte plus the largest block, and
+        cut to the reported length. If the adapter does not support I2C_RDWR
+        the message list is dropped and strings are read one command at a
+        time; after any other error the strings fall back until the next
+        refresh. Only one attempt is made per refresh.
+        """
+        msgs = self._string_msgs
+        if msgs is None:
+            return
+        self._strings_batched = True
+        
+        try:
+            self.bus.i2c_rdwr(*msgs)
+        except OSError as e:
             if self.debug:
-                print(f"read_string(0x{command:02X}, {length}) -> 'Not Available' (error: {e})")
-            return "Not Available"
+                print(f"I2C_RDWR of strings failed ({e}), using block reads")
+            if e.errno in _UNSUPPORTED_ERRNOS:
+                self._string_msgs = None
+            return
+        for command, msg in zip(self._STRING_CMDS, msgs[1::2]):
+            data = bytes(msg)
+            self._block_strings[command] = data[1:1 + min(data[0], I2C_BLOCK_SIZE)]
         
     def get_status(self):
         """
@@ -480,7 +1089,7 @@ class DeltaPSU:
         Get input voltage.
         
         Returns:
-            int: Input voltage in millivolts
+            float: Input voltage in volts
         """
         return self.read_word(CMD_READ_VIN)
         
@@ -489,7 +1098,7 @@ class DeltaPSU:
         Get output voltage.
         
         Returns:
-            int: Output voltage in millivolts
+            float: Output voltage in volts
         """
         return self.read_word(CMD_READ_VOUT)
         
@@ -498,7 +1107,7 @@ class DeltaPSU:
         Get output current.
         
         Returns:
-            int: Output current in milliamperes
+            float: Output current in amperes
         """
         return self.read_word(CMD_READ_IOUT)
         
@@ -507,7 +1116,7 @@ class DeltaPSU:
         Get primary temperature reading.
         
         Returns:
-            int: Temperature in degrees Celsius
+            float: Temperature in degrees Celsius
         """
         return self.read_word(CMD_READ_TEMPERATURE_1)
         
@@ -516,7 +1125,7 @@ class DeltaPSU:
         Get primary fan speed reading.
         
         Returns:
-            int: Fan speed in RPM
+            float: Fan speed in RPM
         """
         return self.read_word(CMD_READ_FAN_SPEED_1)
         
@@ -524,13 +1133,29 @@ class DeltaPSU:
         """
         Get input and output power readings.
         
+        Both readings are decoded from the same cached snapshot, so they
+        are taken from one refresh and never straddle two.
+        
         Returns:
             tuple: (input_power, output_power) in watts
         """
-        pin = self.read_word(CMD_READ_PIN)
-        pout = self.read_word(CMD_READ_POUT)
+        self._ensure_fresh()
+        pin = self._decode_word(CMD_READ_PIN)
+        pout = self._decode_word(CMD_READ_POUT)
         return pin, pout
 
+    def get_snapshot(self):
+        """
+        Get the main readings from a single snapshot.
+        
+        Returns:
+            PsuSnapshot: Input/output voltage, current and power, primary
+                temperature and fan speed, duty cycle and frequency
+        """
+        self._ensure_fresh()
+        decode = self._decode_word
+        return PsuSnapshot._make([decode(command) for command in self._SNAPSHOT_CMDS])
+
     def get_manufacturer_info(self):
         """
         Get manufacturer information.
@@ -538,14 +1163,21 @@ class DeltaPSU:
         Returns:
             dict: Dictionary containing manufacturer information
         """
+        self._ensure_fresh()
+        return self._manufacturer_info()
+        
+    def _manufacturer_info(self):
+        """
+        Decode manufacturer information from hex_data without checking its age.
+        """
         info = {
-            'ID': self.read_string(CMD_MFR_ID),
-            'Model': self.read_string(CMD_MFR_MODEL),
-            'Revision': self.read_string(CMD_MFR_REVISION),
-            'Location': self.read_string(CMD_MFR_LOCATION),
-            'Date': self.read_string(CMD_MFR_DATE),
-            'Serial': self.read_string(CMD_MFR_SERIAL),
-            'PMBus Revision': self.read_byte(CMD_PMBUS_REVISION)
+            'ID': self._read_string(CMD_MFR_ID),
+            'Model': self._read_string(CMD_MFR_MODEL),
+            'Revision': self._read_string(CMD_MFR_REVISION),
+            'Location': self._read_string(CMD_MFR_LOCATION),
+            'Date': self._read_string(CMD_MFR_DATE),
+            'Serial': self._read_string(CMD_MFR_SERIAL),
+            'PMBus Revision': self._read_byte(CMD_PMBUS_REVISION)
         }
         return info
 
@@ -554,7 +1186,7 @@ class DeltaPSU:
         Get switching frequency.
         
         Returns:
-            int: Switching frequency in Hz
+            float: Switching frequency in Hz
         """
         return self.read_word(CMD_READ_FREQUENCY)
 
@@ -563,7 +1195,7 @@ class DeltaPSU:
         Get duty cycle.
         
         Returns:
-            int: Duty cycle percentage
+            float: Duty cycle percentage
         """
         return self.read_word(CMD_READ_DUTY_CYCLE)
 
@@ -574,11 +1206,7 @@ class DeltaPSU:
         Returns:
             dict: Dictionary containing all temperature sensor readings
         """
-        return {
-            'temp1': self.read_word(CMD_READ_TEMPERATURE_1),
-            'temp2': self.read_word(CMD_READ_TEMPERATURE_2),
-            'temp3': self.read_word(CMD_READ_TEMPERATURE_3)
-        }
+        return self._decode_section('temperatures')
 
     def get_all_fan_speeds(self):
         """
@@ -587,12 +1215,7 @@ class DeltaPSU:
         Returns:
             dict: Dictionary containing all fan speed readings
         """
-        return {
-            'fan1': self.read_word(CMD_READ_FAN_SPEED_1),
-            'fan2': self.read_word(CMD_READ_FAN_SPEED_2),
-            'fan3': self.read_word(CMD_READ_FAN_SPEED_3),
-            'fan4': self.read_word(CMD_READ_FAN_SPEED_4)
-        }
+        return self._decode_section('fan_speeds')
 
     def get_all_status(self):
         """
@@ -601,15 +1224,7 @@ class DeltaPSU:
         Returns:
             dict: Dictionary containing all status register values
         """
-        return {
-            'status_word': self.read_word(CMD_STATUS_WORD),
-            'status_vout': self.read_word(CMD_STATUS_VOUT),
-            'status_iout': self.read_word(CMD_STATUS_IOUT),
-            'status_input': self.read_word(CMD_STATUS_INPUT),
-            'status_temperature': self.read_word(CMD_STATUS_TEMPERATURE),
-            'status_cml': self.read_word(CMD_STATUS_CML),
-            'status_other': self.read_word(CMD_STATUS_OTHER)
-        }
+        return self._decode_section('status')
 
     def get_fault_limits(self):
         """
@@ -618,20 +1233,7 @@ class DeltaPSU:
         Returns:
             dict: Dictionary containing all fault and warning limit values
         """
-        return {
-            'iout_oc_fault_limit': self.read_word(CMD_IOUT_OC_FAULT_LIMIT),
-            'iout_oc_warn_limit': self.read_word(CMD_IOUT_OC_WARN_LIMIT),
-            'ot_fault_limit': self.read_word(CMD_OT_FAULT_LIMIT),
-            'ot_warn_limit': self.read_word(CMD_OT_WARN_LIMIT),
-            'ut_fault_limit': self.read_word(CMD_UT_FAULT_LIMIT),
-            'ut_warn_limit': self.read_word(CMD_UT_WARN_LIMIT),
-            'vin_uv_fault_limit': self.read_word(CMD_VIN_UV_FAULT_LIMIT),
-            'vin_uv_warn_limit': self.read_word(CMD_VIN_UV_WARN_LIMIT),
-            'vin_ov_fault_limit': self.read_word(CMD_VIN_OV_FAULT_LIMIT),
-            'vin_ov_warn_limit': self.read_word(CMD_VIN_OV_WARN_LIMIT),
-            'iin_oc_fault_limit': self.read_word(CMD_IIN_OC_FAULT_LIMIT),
-            'iin_oc_warn_limit': self.read_word(CMD_IIN_OC_WARN_LIMIT)
-        }
+        return self._decode_section('fault_limits')
 
     def get_timing_parameters(self):
         """
@@ -640,49 +1242,170 @@ class DeltaPSU:
         Returns:
             dict: Dictionary containing timing parameter values
         """
-        return {
-            'ton_delay': self.read_word(CMD_TON_DELAY),
-            'ton_rise': self.read_word(CMD_TON_RISE),
-            'toff_delay': self.read_word(CMD_TOFF_DELAY),
-            'toff_fall': self.read_word(CMD_TOFF_FALL)
-        }
+        return self._decode_section('timing_parameters')
 
-    def get_all_info(self):
+    def get_all_info(self, sections=None, fresh=False):
         """
         Get all PSU information in a dictionary format.
         
+        Results are reused for cache_ttl seconds. After that the register
+        snapshot is re-read if it is stale, and decoded once.
+        
+        Args:
+            sections (iterable): Only report these entries of SECTIONS
+                (default: all). timestamp and i2c_address are always
+                included; skipping manufacturer_info avoids its string reads.
+            fresh (bool): Re-read the device and skip both caches, so every
+                call returns a new sample
+        
         Returns:
             dict: Dictionary containing all PSU information
         """
+        key = None if sections is None else frozenset(sections)
+        now = time.monotonic()
+        if (not fresh and self._info_cache is not None and self._info_cache_key == key
+                and now - self._info_cache_time < self.cache_ttl):
+            return self._info_cache
+            
         try:
-            mfr_info = self.get_manufacturer_info()
-            pin, pout = self.get_power()
+            if fresh:
+                self.refresh()
+            else:
+                self._ensure_fresh()
+            fields = self._decode_all(key)
+            operating = fields.get('operating_parameters')
+            if operating is not None:
+                pin = operating['input_power']
+                pout = operating['output_power']
+                operating['efficiency'] = round((pout/pin)*100, 2) if pin > 0 else 0
             
             info = {
                 'timestamp': datetime.now().isoformat(),
-                'i2c_address': f"0x{self.address:02X}",
-                'manufacturer_info': mfr_info,
-                'operating_parameters': {
-                    'input_voltage': self.get_vin(),
-                    'output_voltage': self.get_vout(),
-                    'output_current': self.get_iout(),
-                    'temperature': self.get_temperature(),
-                    'fan_speed': self.get_fan_speed(),
-                    'switching_frequency': self.get_frequency(),
-                    'duty_cycle': self.get_duty_cycle(),
-                    'input_power': pin,
-                    'output_power': pout,
-                    'efficiency': round((pout/pin)*100, 2) if pin > 0 else 0
-                },
-                'temperatures': self.get_all_temperatures(),
-                'fan_speeds': self.get_all_fan_speeds(),
-                'status': self.get_all_status(),
-                'fault_limits': self.get_fault_limits(),
-                'timing_parameters': self.get_timing_parameters()
+                'i2c_address': f"0x{self.address:02X}"
             }
+            if key is None or 'manufacturer_info' in key:
+                info['manufacturer_info'] = self._manufacturer_info()
+            info.update(fields)
+            self._info_cache = info
+            self._info_cache_key = key
+            self._info_cache_time = now
             return info
         except Exception as e:
             return {'error': str(e)}
+            
+    def close(self):
+        """
+        Close the I2C bus. Does nothing in file mode.
+        """
+        if self._raw is not None:
+            self._raw.close()
+            self._raw = None
+        if self.bus is not None:
+            self.bus.close()
+            self.bus = None
+
+class AsyncDeltaPSU:
+    """
+    asyncio wrapper around DeltaPSU.
+    
+    Every call is run on a single worker thread, so bus transactions stay
+    serialized while the event loop keeps running. Use create() to open the
+    device without blocking the loop, and close() (or async with) to release
+    it.
+    
+    Attributes:
+        psu (DeltaPSU): Wrapped synchronous interface
+    """
+    
+    def __init__(self, psu, executor=None):
+        """
+        Wrap an existing PSU interface.
+        
+        Args:
+            psu (DeltaPSU): Synchronous PSU interface
+            executor (ThreadPoolExecutor): Executor to run calls on
+                (default: a new single-thread executor)
+        """
+        self.psu = psu
+        self._executor = executor or ThreadPoolExecutor(max_workers=1)
+        self._closed = False
+        
+    @classmethod
+    async def create(cls, **kwargs):
+        """
+        Open a PSU on the worker thread.
+        
+        Args:
+            **kwargs: Arguments passed to DeltaPSU
+            
+        Returns:
+            AsyncDeltaPSU: Wrapper around the new PSU interface
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        loop = asyncio.get_running_loop()
+        try:
+            psu = await loop.run_in_executor(executor, functools.partial(DeltaPSU, **kwargs))
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+        return cls(psu, executor)
+        
+    async def _call(self, func, *args):
+        """
+        Run a DeltaPSU method on the worker thread and await its result.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        
+    async def read_byte(self, command):
+        """See DeltaPSU.read_byte."""
+        return await self._call(self.psu.read_byte, command)
+        
+    async def read_word(self, command):
+        """See DeltaPSU.read_word."""
+        return await self._call(self.psu.read_word, command)
+        
+    async def read_string(self, command, length=16):
+        """See DeltaPSU.read_string."""
+        return await self._call(self.psu.read_string, command, length)
+        
+    async def refresh(self):
+        """See DeltaPSU.refresh."""
+        return await self._call(self.psu.refresh)
+        
+    async def get_all_info(self, sections=None, fresh=False):
+        """See DeltaPSU.get_all_info."""
+        return await self._call(self.psu.get_all_info, sections, fresh)
+        
+    async def close(self):
+        """
+        Close the wrapped DeltaPSU on the worker thread once pending calls
+        finish, then shut the worker down. Further calls do nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        await self._call(self.psu.close)
+        self._executor.shutdown(wait=False)
+        
+    async def __aenter__(self):
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+# Unit suffix for each measurement in human-readable output. Fields not
+# listed have no unit.
+FIELD_UNITS = {
+    'vin': 'V',
+    'vout': 'V',
+    'iout': 'A',
+    'temperature': '\u00B0C',
+    'fan_speed': ' RPM',
+    'duty_cycle': '%',
+    'frequency': ' Hz',
+    'pout': 'W',
+    'pin': 'W'
+}
 
 def format_human_readable(data):
     """
@@ -705,51 +1428,173 @@ def format_human_readable(data):
     output.append(f"Revision: {data['revision']}")
     
     output.append("\nStatus:")
-    for key, value in data['status'].items():
-        output.append(f"{key}: 0x{value:04X}")
+    output.extend(f"{key}: 0x{value:04X}" for key, value in data['status'].items())
     
     output.append("\nMeasurements:")
-    for key, value in data['measurements'].items():
-        if key in ['vin', 'vout']:
-            output.append(f"{key}: {value}V")
-        elif key == 'iout':
-            output.append(f"{key}: {value}A")
-        elif key == 'temperature':
-            output.append(f"{key}: {value}°C")
-        elif key == 'fan_speed':
-            output.append(f"{key}: {value} RPM")
-        elif key == 'duty_cycle':
-            output.append(f"{key}: {value}%")
-        elif key == 'frequency':
-            output.append(f"{key}: {value} Hz")
-        elif key in ['pout', 'pin']:
-            output.append(f"{key}: {value}W")
-        else:
-            output.append(f"{key}: {value}")
+    units = FIELD_UNITS.get
+    output.extend(f"{key}: {value}{units(key, '')}" for key, value in data['measurements'].items())
     
     return "\n".join(output)
 
+def _dump(obj, stream, indent=True):
+    """
+    Write obj to a text stream as JSON followed by a newline.
+    
+    With orjson the encoded bytes go straight to the stream's binary
+    buffer when it has one. The json fallback encodes with json.dumps()
+    and writes the text and the newline separately, so no second copy of
+    the output is built; json.dump() would instead issue one write per
+    encoder chunk.
+    
+    Args:
+        obj: Object to serialize
+        stream: Text stream, e.g. sys.stdout or a file opened with 'w'
+        indent (bool): Indent by two spaces; otherwise emit one compact line
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(obj, option=option)
+        buffer = getattr(stream, 'buffer', None)
+        if buffer is not None:
+            # Text written earlier must reach the buffer first
+            stream.flush()
+            buffer.write(data)
+        else:
+            stream.write(data.decode())
+    else:
+        if indent:
+            stream.write(json.dumps(obj, indent=2))
+        else:
+            stream.write(json.dumps(obj, separators=(',', ':')))
+        stream.write('\n')
+
+def run_daemon(psu, interval, sections=None):
+    """
+    Print get_all_info() as one JSON line per interval until interrupted.
+    
+    The PSU (and its I2C bus) stays open between samples. Every tick
+    re-reads the device, regardless of cache_ttl. SIGTERM and Ctrl-C stop
+    the loop and close the bus.
+    
+    Args:
+        psu (DeltaPSU): Open PSU interface
+        interval (float): Seconds between samples
+        sections (iterable): Sections passed to get_all_info() (default: all)
+        
+    Returns:
+        int: Exit status
+    """
+    def stop(signum, frame):
+        raise SystemExit(0)
+    signal.signal(signal.SIGTERM, stop)
+    
+    try:
+        next_tick = time.monotonic()
+        while True:
+            _dump(psu.get_all_info(sections, fresh=True), sys.stdout, indent=False)
+            sys.stdout.flush()
+            # Sleep to the next tick so the read time does not add drift.
+            # After a tick that overran, start again from now instead of
+            # firing the missed samples back to back.
+            next_tick += interval
+            now = time.monotonic()
+            if next_tick < now:
+                next_tick = now
+            time.sleep(next_tick - now)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        psu.close()
+    return 0
+
+def _hex_int(value):
+    """
+    argparse type for hex numbers; '60' and '0x60' both mean 0x60.
+    
+    Args:
+        value (str): Command line value
+        
+    Returns:
+        int: Parsed value
+    """
+    return int(value, 16)
+
+def _positive_float(value):
+    """
+    argparse type for a finite number of seconds greater than zero.
+    
+    Args:
+        value (str): Command line value
+        
+    Returns:
+        float: Parsed value
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    if not 0 < seconds < float('inf'):
+        raise argparse.ArgumentTypeError(f"must be a finite number greater than 0: {value!r}")
+    return seconds
+
+def _section_list(value):
+    """
+    argparse type for a comma separated list of get_all_info() sections.
+    
+    Args:
+        value (str): Command line value, e.g. 'operating_parameters,status'
+        
+    Returns:
+        tuple: Section names
+    """
+    sections = tuple(name.strip() for name in value.split(',') if name.strip())
+    unknown = [name for name in sections if name not in DeltaPSU.SECTIONS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown section(s) {', '.join(unknown)}; choose from {', '.join(DeltaPSU.SECTIONS)}")
+    return sections
+
 def main():
     parser = argparse.ArgumentParser(description='Delta PSU PMBus Reader')
     parser.add_argument('--json', action='store_true', help='Output in JSON format')
     parser.add_argument('--output', type=str, help='Output file path')
-    parser.add_argument('--address', type=str, default='0x60', help='I2C address (default: 0x60)')
+    parser.add_argument('--address', type=_hex_int, default=I2C_ADDRESS,
+                        help='I2C address in hex, with or without 0x (default: 0x60)')
     parser.add_argument('--bus', type=int, default=1, help='I2C bus number (default: 1)')
     parser.add_argument('--file', type=str, help='Read from hex dump file instead of I2C')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
+    parser.add_argument('--cache-ms', type=int, default=1000,
+                        help='Reuse readings for this many milliseconds before re-reading the device '
+                             '(default: 1000, 0 re-reads on every access)')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Keep the bus open and print get_all_info() as one JSON line per interval')
+    parser.add_argument('--interval', type=_positive_float, default=1.0,
+                        help='Seconds between samples in daemon mode (default: 1.0)')
+    parser.add_argument('--sections', type=_section_list,
+                        help='Comma separated get_all_info() sections to report in daemon mode, '
+                             'e.g. operating_parameters,status (default: all)')
     args = parser.parse_args()
+    if args.sections is not None and not args.daemon:
+        parser.error('--sections only applies to --daemon output')
+    if args.daemon and (args.json or args.output):
+        parser.error('--daemon always writes JSON lines to stdout; drop --json/--output')
 
     try:
-        # Convert address string to integer
-        address = int(args.address, 16)
-        
         # Initialize PSU interface
-        psu = DeltaPSU(bus_number=args.bus, address=address, hex_file=args.file, debug=args.debug)
+        psu = DeltaPSU(bus_number=args.bus, address=args.address, hex_file=args.file, debug=args.debug,
+                       cache_ttl=args.cache_ms / 1000.0)
+        
+        if args.daemon:
+            return run_daemon(psu, args.interval, args.sections)
         
         if args.debug:
             print("\nCollecting PSU information...")
         
         # Get PSU information
+        # No fan status register is mapped, so 'fan' reports STATUS_OTHER
+        status_other = psu.read_word(CMD_STATUS_OTHER)
         data = {
             'timestamp': datetime.now().isoformat(),
             'manufacturer': psu.read_string(CMD_MFR_ID),
@@ -761,38 +1606,28 @@ def main():
                 'vin': psu.read_word(CMD_STATUS_VOUT),
                 'iout': psu.read_word(CMD_STATUS_IOUT),
                 'temperature': psu.read_word(CMD_STATUS_TEMPERATURE),
-                'fan': psu.read_word(CMD_STATUS_OTHER),
-                'other': psu.read_word(CMD_STATUS_OTHER)
+                'fan': status_other,
+                'other': status_other
             },
-            'measurements': {
-                'vin': psu.get_vin(),
-                'vout': psu.get_vout(),
-                'iout': psu.get_iout(),
-                'temperature': psu.get_temperature(),
-                'fan_speed': psu.get_fan_speed(),
-                'duty_cycle': psu.get_duty_cycle(),
-                'frequency': psu.get_frequency(),
-                'pout': psu.get_power()[1],
-                'pin': psu.get_power()[0]
-            }
+            'measurements': psu.get_snapshot()._asdict()
         }
 
         if args.debug:
             print("\nCollected data:")
-            print(json.dumps(data, indent=2))
-
-        if args.json:
-            output = json.dumps(data, indent=2)
-        else:
-            output = format_human_readable(data)
+            _dump(data, sys.stdout)
 
         if args.output:
             with open(args.output, 'w') as f:
-                f.write(output)
+                if args.json:
+                    _dump(data, f)
+                else:
+                    f.write(format_human_readable(data))
             if args.debug:
                 print(f"\nData saved to {args.output}")
+        elif args.json:
+            _dump(data, sys.stdout)
         else:
-            print(output)
+            print(format_human_readable(data))
 
     except Exception as e:
         print(f"Error: {e}")